@@ -11,7 +11,7 @@ import logging
 import math
 import os
 from time import sleep
-from typing import Any, Callable, cast, Dict, List, TypedDict
+from typing import Any, Callable, cast, Dict, List, Sequence, TypedDict
 
 import requests
 from file_catalog.schema import types
@@ -150,7 +150,7 @@ async def index_paths(
     return child_paths
 
 
-def path_in_denylist(path: str, denylist: List[str]) -> bool:
+def path_in_denylist(path: str, denylist: Sequence[str]) -> bool:
     """Return `True` if `path` is denylisted.
 
     Either:
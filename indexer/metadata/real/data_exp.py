@@ -9,7 +9,7 @@ import tarfile
 import xml
 import zlib
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Final, List, Optional, Pattern, Tuple, cast
 
 import xmltodict
 from file_catalog.schema import types
@@ -19,16 +19,22 @@ from ..i3 import I3FileMetadata
 
 StrDict = Dict[str, Any]
 
+_RUN_NUMBER_RE = re.compile(r".*Run(?P<run>\d+)")
+
 
 class DataExpI3FileMetadata(I3FileMetadata):
     """Metadata for /data/exp/ i3 files."""
 
+    # every base pattern & filename pattern requires this literal, so a filename
+    # without it is rejected with one substring scan, before any regex is run
+    REQUIRED_SUBSTRING: Final[str] = "Run"
+
     def __init__(
         self,
         file: utils.FileInfo,
         site: str,
         processing_level: utils.ProcessingLevel,
-        filename_patterns_: List[str],
+        filename_patterns_: List[Pattern[str]],
     ):
         super().__init__(file, site, processing_level, "real")
         if not self.processing_level:
@@ -73,44 +79,36 @@ class DataExpI3FileMetadata(I3FileMetadata):
 
     @staticmethod
     def parse_year_run_subrun_part(
-        patterns: List[str], filename: str
+        patterns: List[Pattern[str]], filename: str
     ) -> Tuple[Optional[int], int, int, int]:
         r"""Return the year, run, subrun, and part by parsing the `filename` according to regex `patterns`.
 
         Uses named groups: `year`, `run`, `subrun`, and `part`.
         - Only a `run` group is required in the filename/regex pattern.
         - Optionally include `ic_strings` group (\d+), instead of `year` group.
+
+        `patterns` are pre-compiled (see the `FILENAME_PATTERNS` class
+        attributes).
         """
         for p in patterns:
-            if "?P<run>" not in p:
-                raise Exception(f"Pattern does not have `run` regex group, {p}.")
+            if "run" not in p.groupindex:
+                raise Exception(
+                    f"Pattern does not have `run` regex group, {p.pattern}."
+                )
 
-            match = re.match(p, filename)
+            match = p.match(filename)
             if match:
+                # one `groupdict()` call -- absent groups fall back to defaults
                 values = match.groupdict()
-                # get year
                 if "ic_strings" in values:
                     year = utils.IceCubeSeason.name_to_year(f"IC{values['ic_strings']}")
+                elif "year" in values:
+                    year = int(values["year"])
                 else:
-                    try:
-                        year = int(values["year"])
-                    except KeyError:
-                        year = None
-                # get run
-                try:
-                    run = int(values["run"])
-                except KeyError:
-                    run = 0
-                # get subrun
-                try:
-                    subrun = int(values["subrun"])
-                except KeyError:
-                    subrun = 0
-                # get part
-                try:
-                    part = int(values["part"])
-                except KeyError:
-                    part = 0
+                    year = None
+                run = int(values["run"])  # required, checked above
+                subrun = int(values.get("subrun", 0))
+                part = int(values.get("part", 0))
 
                 return year, run, subrun, part
 
@@ -123,7 +121,7 @@ class DataExpI3FileMetadata(I3FileMetadata):
         # Ex: Level2_IC86.2017_data_Run00130484_0101_71_375_GCD.i3.zst
         # Ex: Level2_IC86.2017_data_Run00130567_Subrun00000000_00000280.i3.zst
         # Ex: Run00125791_GapsTxt.tar
-        match = re.match(r".*Run(?P<run>\d+)", filename)
+        match = _RUN_NUMBER_RE.match(filename)
         try:
             run = match.groupdict()["run"]  # type: ignore[union-attr]
             return int(run)
@@ -3,7 +3,7 @@
 
 import datetime
 import re
-from typing import Any, Dict, Final, List, Optional, Tuple, cast
+from typing import Any, Dict, Final, List, Optional, Pattern, Tuple, cast
 
 from file_catalog.schema import types
 
@@ -15,7 +15,12 @@ from .data_exp import DataExpI3FileMetadata
 class L2FileMetadata(DataExpI3FileMetadata):
     """Metadata for L2 i3 files."""
 
-    FILENAME_PATTERNS: Final[List[str]] = filename_patterns.L2["patterns"]
+    BASE_PATTERN: Final[Pattern[str]] = re.compile(
+        filename_patterns.L2["base_pattern"]
+    )
+    FILENAME_PATTERNS: Final[List[Pattern[str]]] = [
+        re.compile(p) for p in filename_patterns.L2["patterns"]
+    ]
 
     def __init__(  # pylint: disable=R0913
         self,
@@ -124,4 +129,6 @@ class L2FileMetadata(DataExpI3FileMetadata):
         Check if `filename` matches the base filename pattern for L2
         files.
         """
-        return bool(re.match(filename_patterns.L2["base_pattern"], filename))
+        if L2FileMetadata.REQUIRED_SUBSTRING not in filename:
+            return False
+        return bool(L2FileMetadata.BASE_PATTERN.match(filename))
@@ -2,7 +2,7 @@
 
 
 import re
-from typing import Final, List
+from typing import Final, List, Pattern
 
 from ...utils import utils
 from . import filename_patterns
@@ -12,7 +12,12 @@ from .data_exp import DataExpI3FileMetadata
 class PFFiltFileMetadata(DataExpI3FileMetadata):
     """Metadata for PFFilt i3 files."""
 
-    FILENAME_PATTERNS: Final[List[str]] = filename_patterns.PFFilt["patterns"]
+    BASE_PATTERN: Final[Pattern[str]] = re.compile(
+        filename_patterns.PFFilt["base_pattern"]
+    )
+    FILENAME_PATTERNS: Final[List[Pattern[str]]] = [
+        re.compile(p) for p in filename_patterns.PFFilt["patterns"]
+    ]
 
     def __init__(self, file: utils.FileInfo, site: str):
         super().__init__(
@@ -30,4 +35,6 @@ class PFFiltFileMetadata(DataExpI3FileMetadata):
         Check if `filename` matches the base filename pattern for PFFilt
         files.
         """
-        return bool(re.match(filename_patterns.PFFilt["base_pattern"], filename))
+        if PFFiltFileMetadata.REQUIRED_SUBSTRING not in filename:
+            return False
+        return bool(PFFiltFileMetadata.BASE_PATTERN.match(filename))
@@ -2,7 +2,7 @@
 
 
 import re
-from typing import Final, List
+from typing import Final, List, Pattern
 
 from ...utils import utils
 from . import filename_patterns
@@ -12,7 +12,12 @@ from .data_exp import DataExpI3FileMetadata
 class PFRawFileMetadata(DataExpI3FileMetadata):
     """Metadata for PFRaw i3 files."""
 
-    FILENAME_PATTERNS: Final[List[str]] = filename_patterns.PFRaw["patterns"]
+    BASE_PATTERN: Final[Pattern[str]] = re.compile(
+        filename_patterns.PFRaw["base_pattern"]
+    )
+    FILENAME_PATTERNS: Final[List[Pattern[str]]] = [
+        re.compile(p) for p in filename_patterns.PFRaw["patterns"]
+    ]
 
     def __init__(self, file: utils.FileInfo, site: str):
         super().__init__(
@@ -27,4 +32,6 @@ class PFRawFileMetadata(DataExpI3FileMetadata):
         Check if `filename` matches the base filename pattern for PFRaw
         files.
         """
-        return bool(re.match(filename_patterns.PFRaw["base_pattern"], filename))
+        if PFRawFileMetadata.REQUIRED_SUBSTRING not in filename:
+            return False
+        return bool(PFRawFileMetadata.BASE_PATTERN.match(filename))
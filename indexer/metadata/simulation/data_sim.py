@@ -3,7 +3,7 @@
 
 import logging
 import re
-from typing import Dict, List, Optional, Pattern, Tuple
+from typing import Dict, Final, List, Optional, Pattern, Tuple
 
 from file_catalog.schema import types
 
@@ -20,6 +20,35 @@ from .iceprod_tools import (
 class DataSimI3FileMetadata(I3FileMetadata):
     """Metadata for /data/sim/ i3 files."""
 
+    # L5 - L1 -> Triggered -> Propagated -> Generated
+    # (matched case-insensitively, so uppercase them once here, not per filename)
+    _PROC_LEVEL_STRINGS: Final[Dict[utils.ProcessingLevel, Tuple[str, ...]]] = {
+        proc_level: tuple(t.upper() for t in strings)
+        for proc_level, strings in {
+            utils.ProcessingLevel.L5: ["L5"],  # implicitly, also "level5"
+            utils.ProcessingLevel.L4: ["L4"],  # ``
+            utils.ProcessingLevel.L3: ["L3"],  # ``
+            utils.ProcessingLevel.L2: ["L2"],  # ``
+            utils.ProcessingLevel.L1: ["L1"],  # ``
+            utils.ProcessingLevel.Triggered: ["detector"],
+            utils.ProcessingLevel.Propagated: ["hits", "hit", "propagated"],
+            utils.ProcessingLevel.Generated: [
+                "corsika",
+                "unweighted",
+                "nugen",
+                "injector",  # MCSNInjector, SimpleInjector, lepton-injector
+                "genie",
+                "generated",
+                "numu",
+                "nue",
+                "nutau",
+                "muongun",
+                "Monopole",
+                "MonoSim",
+            ],
+        }.items()
+    }
+
     def __init__(  # pylint: disable=R0913
         self,
         file: utils.FileInfo,
@@ -49,32 +78,8 @@ class DataSimI3FileMetadata(I3FileMetadata):
         """Get the processing level from the filename."""
         fname_upper = file.name.upper()
 
-        # L5 - L1 -> Triggered -> Propagated -> Generated
-        proc_level_strings = {
-            utils.ProcessingLevel.L5: ["L5"],  # implicitly, also "level5"
-            utils.ProcessingLevel.L4: ["L4"],  # ``
-            utils.ProcessingLevel.L3: ["L3"],  # ``
-            utils.ProcessingLevel.L2: ["L2"],  # ``
-            utils.ProcessingLevel.L1: ["L1"],  # ``
-            utils.ProcessingLevel.Triggered: ["detector"],
-            utils.ProcessingLevel.Propagated: ["hits", "hit", "propagated"],
-            utils.ProcessingLevel.Generated: [
-                "corsika",
-                "unweighted",
-                "nugen",
-                "injector",  # MCSNInjector, SimpleInjector, lepton-injector
-                "genie",
-                "generated",
-                "numu",
-                "nue",
-                "nutau",
-                "muongun",
-                "Monopole",
-                "MonoSim",
-            ],
-        }
-        for proc_level, strings in proc_level_strings.items():
-            if any(t.upper() in fname_upper for t in strings):
+        for proc_level, strings in DataSimI3FileMetadata._PROC_LEVEL_STRINGS.items():
+            if any(t in fname_upper for t in strings):
                 return proc_level
 
         return None
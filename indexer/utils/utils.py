@@ -12,6 +12,9 @@ class FileInfo:  # pylint: disable=R0903
     Similar to os.DirEntry.
     """
 
+    # one instance per indexed file -- skip the per-instance `__dict__`
+    __slots__ = ("path", "name")
+
     def __init__(self, filepath: str):
         self.path = filepath
         self.name = os.path.basename(self.path)
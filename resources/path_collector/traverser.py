@@ -2,41 +2,82 @@
 
 import logging
 import os
+import re
 import stat
-from concurrent.futures import Future, ProcessPoolExecutor
-from time import sleep
-from typing import List, Tuple
-
-import coloredlogs  # type: ignore[import]
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, List, Optional, Pattern, Set, Tuple
 
 from resources.path_collector.common_args import (  # isort:skip  # noqa # pylint: disable=E0401,C0413,C0411
     get_parser_w_common_args,
     get_full_path,
 )
 
+# file-type bits of `st_mode` (what `stat.S_IFMT()` masks)
+_S_IFMT = 0o170000
+# symbolic links, sockets, FIFOs, devices, and char devices
+_NON_PROCESSABLE_TYPES = frozenset(
+    {stat.S_IFLNK, stat.S_IFSOCK, stat.S_IFIFO, stat.S_IFBLK, stat.S_IFCHR}
+)
 
-def is_excluded_path(path: str, excluded_paths: List[str]) -> bool:
-    """Return `True` if `path` should be excluded.
 
-    Either:
-    - `path` is in `excluded_paths`, or
-    - `path` has a parent path in `excluded_paths`.
+# paths are handled as bytes (`os.fsencode`) -- no str decoding/encoding per entry
+_SEP = os.fsencode(os.sep)
+
+
+def compile_excluded_paths(excluded_paths: List[str]) -> Optional[Pattern[bytes]]:
+    """Return a regex matching any path that is, or is nested under, an excluded path.
+
+    The regex matches bytes paths. Return `None` if there are no excluded paths.
     """
-    for excl in excluded_paths:
-        if (path == excl) or (os.path.commonpath([path, excl]) == excl):
-            logging.info(
-                f"Skipping {path}, file and/or directory path is in `--exclude` ({excl})."
-            )
-            return True
-    return False
+    if not excluded_paths:
+        return None
+    alternation = b"|".join(
+        re.escape(os.fsencode(excl).rstrip(_SEP)) for excl in excluded_paths
+    )
+    # `\Z`, not `$` -- `$` also matches before a trailing newline
+    return re.compile(
+        rb"(?P<excl>" + alternation + rb")(?:" + re.escape(_SEP) + rb"|\Z)"
+    )
 
 
-def scan_directory(path: str, excluded_paths: List[str]) -> Tuple[List[str], List[str]]:
+def is_excluded_path(path: bytes, excluded_re: Optional[Pattern[bytes]]) -> bool:
+    """Return `True` if `path` should be excluded.
+
+    Either:
+    - `path` is an excluded path, or
+    - `path` has a parent path that is an excluded path.
+
+    `excluded_re` is made by `compile_excluded_paths()`.
+    """
+    if not excluded_re:
+        return False
+    match = excluded_re.match(path)
+    if not match:
+        return False
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(
+            "Skipping %s, file and/or directory path is in `--exclude` (%s).",
+            os.fsdecode(path),
+            os.fsdecode(match["excl"]),
+        )
+    return True
+
+
+def scan_directory(
+    path: bytes, excluded_re: Optional[Pattern[bytes]]
+) -> Tuple[List[bytes], List[bytes]]:
     """Return sub-directories' paths and regular-file's paths.
 
     Ignore all other file types.
     """
-    logging.debug(f"Scanning directory: {path}...")
+    # hot path: use lazy %-formatting, and skip the calls entirely when disabled
+    info_on = logging.getLogger().isEnabledFor(logging.INFO)
+    debug_on = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+    if debug_on:
+        logging.debug("Scanning directory: %s...", os.fsdecode(path))
 
     try:
         scan = os.scandir(path)
@@ -46,35 +87,38 @@ def scan_directory(path: str, excluded_paths: List[str]) -> Tuple[List[str], Lis
     subdirs = []
     filepaths = []
     for dir_entry in scan:
+        entry_path = dir_entry.path
         try:
-            mode = os.lstat(dir_entry.path).st_mode
-            if (
-                stat.S_ISLNK(mode)
-                or stat.S_ISSOCK(mode)  # noqa: W503
-                or stat.S_ISFIFO(mode)  # noqa: W503
-                or stat.S_ISBLK(mode)  # noqa: W503
-                or stat.S_ISCHR(mode)  # noqa: W503
-            ):
-                logging.info(f"Non-processable file: {dir_entry.path}")
+            # the lstat result is cached on the DirEntry
+            mode = dir_entry.stat(follow_symlinks=False).st_mode
+            if (mode & _S_IFMT) in _NON_PROCESSABLE_TYPES:
+                if info_on:
+                    logging.info("Non-processable file: %s", os.fsdecode(entry_path))
                 continue
         except PermissionError:
-            logging.info(f"Permission denied: {dir_entry.path}")
+            if info_on:
+                logging.info("Permission denied: %s", os.fsdecode(entry_path))
             continue
 
-        if is_excluded_path(dir_entry.path, excluded_paths):
+        if is_excluded_path(entry_path, excluded_re):
             continue
 
-        # append if it's a directory
-        if dir_entry.is_dir():
-            subdirs.append(dir_entry.path)
+        # append if it's a directory -- reuse `mode`, symlinks were already skipped
+        if stat.S_ISDIR(mode):
+            subdirs.append(entry_path)
         # print if it's a good file
-        elif dir_entry.is_file():
-            if not dir_entry.path.strip():
-                logging.info(f"Blank file name in: {os.path.dirname(dir_entry.path)}")
+        elif stat.S_ISREG(mode):
+            if not entry_path.strip():
+                if info_on:
+                    logging.info(
+                        "Blank file name in: %s",
+                        os.fsdecode(os.path.dirname(entry_path)),
+                    )
             else:
-                filepaths.append(dir_entry.path)
+                filepaths.append(entry_path)
 
-    logging.debug(f"Scan finished, directory: {path}")
+    if debug_on:
+        logging.debug("Scan finished, directory: %s", os.fsdecode(path))
     return subdirs, filepaths
 
 
@@ -92,38 +136,53 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    dirs = args.paths
-    futures: List[Future[Tuple[List[str], List[str]]]] = []  # pylint: disable=E1136
+    excluded_re = compile_excluded_paths(args.exclude)
+
+    # only keep a bounded number of scans in-flight, the rest wait in the deque
+    max_in_flight = args.workers * 4
+    pending_dirs: Deque[bytes] = deque(os.fsencode(p) for p in args.paths)
+    in_flight: Set[Future[Tuple[List[bytes], List[bytes]]]] = set()  # pylint: disable=E1136
     all_file_count = 0
-    with ProcessPoolExecutor(max_workers=args.workers) as pool:
-        while futures or dirs:
+    # scanning is I/O-bound (readdir/lstat release the GIL), so threads suffice
+    # -- and nothing needs to be pickled to reach the workers
+    out = sys.stdout.buffer
+    info_on = logging.getLogger().isEnabledFor(logging.INFO)
+    debug_on = logging.getLogger().isEnabledFor(logging.DEBUG)
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        while pending_dirs or in_flight:
             # submit directory-paths for scanning
-            for dir_path in dirs:
-                logging.debug(f"Submitting directory: {dir_path}...")
-                futures.append(pool.submit(scan_directory, dir_path, args.exclude))
-            # get next finished future
-            while True:
-                try:
-                    fin_future = next(f for f in futures if f.done())
-                    futures.remove(fin_future)
-                    break
-                except StopIteration:  # there were no finished futures
-                    sleep(0.1)
-            # grab subdirectories for traversing and print filepaths
-            dirs, filepaths = fin_future.result()
-            result_file_count = 0
-            for fpath in filepaths:
-                try:
-                    print(fpath)
+            while pending_dirs and len(in_flight) < max_in_flight:
+                dir_path = pending_dirs.popleft()
+                if debug_on:
+                    logging.debug("Submitting directory: %s...", os.fsdecode(dir_path))
+                in_flight.add(pool.submit(scan_directory, dir_path, excluded_re))
+            # get finished futures
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fin_future in done:
+                # grab subdirectories for traversing and print filepaths
+                dirs, filepaths = fin_future.result()
+                pending_dirs.extend(dirs)
+                result_file_count = 0
+                for fpath in filepaths:
+                    try:
+                        # non-UTF-8 names are always skipped -- regardless of locale
+                        fpath.decode()
+                    except UnicodeDecodeError:
+                        if info_on:
+                            parent = os.fsdecode(os.path.dirname(fpath))
+                            logging.info("Invalid file name in: %s", parent)
+                        continue
+                    out.write(fpath + b"\n")
                     result_file_count += 1
-                except UnicodeEncodeError:
-                    logging.info(f"Invalid file name in: {os.path.dirname(fpath)}")
-            all_file_count += result_file_count
+                all_file_count += result_file_count
 
-    logging.info(f"File Count: {all_file_count}")
+    logging.info("File Count: %s", all_file_count)
 
 
 if __name__ == "__main__":
+    # only needed when run as a script -- keep it off of the import path
+    import coloredlogs  # type: ignore[import]  # pylint: disable=C0415
+
     coloredlogs.install(level="DEBUG")
     # logging.basicConfig(level=logging.DEBUG)
     main()
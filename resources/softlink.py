@@ -3,24 +3,54 @@
 
 import os
 import sys
+from typing import List
 
 
 def find_soft_links(root: str) -> None:
-    """Walk the provided tree and print out softlinks."""
-    for foldername, subfolders, filenames in os.walk(root):
-        # check for soft links in folders
-        for subfolder in subfolders:
-            path = os.path.join(foldername, subfolder)
-            if os.path.islink(path):
-                target = os.readlink(path)
-                print(f"{path} -> {target}")
-
-        # check for soft links in files
-        for filename in filenames:
-            path = os.path.join(foldername, filename)
-            if os.path.islink(path):
-                target = os.readlink(path)
-                print(f"{path} -> {target}")
+    """Walk the provided tree and print out softlinks.
+
+    Like `os.walk` (top-down): symbolic links to directories are not
+    followed, directories that can't be opened or fully read are skipped,
+    and links print in the same order -- per directory, links to
+    directories first, then the rest.
+    """
+    dirs = [root]
+    while dirs:
+        dir_path = dirs.pop()
+        try:
+            # readlink relative to the open directory -- no full-path resolution
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+
+        try:
+            try:
+                with os.scandir(dir_fd) as scan:
+                    entries = list(scan)
+            except OSError:
+                continue  # like `os.walk`, skip the whole directory
+
+            dir_links: List[str] = []
+            other_links: List[str] = []
+            subdirs: List[str] = []
+            for dir_entry in entries:
+                try:
+                    is_dir = dir_entry.is_dir()  # follows symlinks, like `os.walk`
+                except OSError:
+                    is_dir = False
+                if dir_entry.is_symlink():
+                    (dir_links if is_dir else other_links).append(dir_entry.name)
+                elif is_dir:
+                    subdirs.append(os.path.join(dir_path, dir_entry.name))
+
+            for name in dir_links + other_links:
+                target = os.readlink(name, dir_fd=dir_fd)
+                print(f"{os.path.join(dir_path, name)} -> {target}")
+        finally:
+            os.close(dir_fd)
+
+        # descend in listing order
+        dirs.extend(reversed(subdirs))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 """Example file metadata."""
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-EXAMPLES: Dict[str, Dict[str, Any]] = {
+_EXAMPLES: Dict[str, Dict[str, Any]] = {
     "PFRaw/SPS-CV-DATA-PFRaw_TestData_RandomFiltering_Run00115379_Subrun00000001_00000000.tar.gz": {
         "_links": {
             "parent": {"href": "/api/files"},
@@ -173,3 +174,8 @@ EXAMPLES: Dict[str, Dict[str, Any]] = {
         "uuid": "c69f23f8-84ac-11ea-ac32-26f2811e2864",
     },
 }
+
+# read-only views -- copy an example before modifying it
+EXAMPLES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {fpath: MappingProxyType(metadata) for fpath, metadata in _EXAMPLES.items()}
+)
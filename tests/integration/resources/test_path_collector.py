@@ -2,28 +2,56 @@
 
 
 import filecmp
-import glob
 import logging
 import os
 from pathlib import Path
 import re
 import shutil
-import stat
 import subprocess
-import time
-from typing import Any, Final, List, Tuple
+import sys
+import tempfile
+from typing import Final, Iterator, List, Tuple
 
-import bitmath  # type: ignore[import]
 import coloredlogs  # type: ignore[import]
 import pytest
 
-from resources.path_collector import common_args, path_collector  # isort:skip  # noqa # pylint: disable=E0401,C0413,C0411
+from resources.path_collector import common_args, path_collector, traverser  # isort:skip  # noqa # pylint: disable=E0401,C0413,C0411
 # import resources.path_collector.common_args as common_args
 # import resources.path_collector.path_collector as path_collector
 
 # logging.getLogger().setLevel("DEBUG")
 coloredlogs.install(level="DEBUG")
 
+_CHUNK_RE = re.compile(r"chunk-(\d+)$")
+
+
+@pytest.fixture(scope="session")
+def _fast_tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Get a session-wide root for test trees, on tmpfs (/dev/shm) if available.
+
+    The traverser stats/scans these trees repeatedly, so keep them in memory.
+    """
+    if not os.path.isdir("/dev/shm"):
+        yield tmp_path_factory.mktemp("path-collector")
+        return
+    root = Path(tempfile.mkdtemp(prefix="path-collector-", dir="/dev/shm"))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def fast_tmp_path(_fast_tmp_root: Path) -> Path:
+    """Get a unique directory for a test's trees (like `tmp_path`)."""
+    return Path(tempfile.mkdtemp(dir=_fast_tmp_root))
+
+
+@pytest.fixture(scope="session")
+def prebuilt_root(_fast_tmp_root: Path) -> str:
+    """Get the traverse root of a test tree shared by all tests that only read it."""
+    root = f"{_fast_tmp_root}/test-traverse-prebuilt"
+    _write_tree(root)
+    return common_args.get_full_path(root)
+
 
 def _make_traverse_staging_dir(stage: str, traverse_root: str) -> None:
     # pylint: disable=W0212
@@ -33,12 +61,13 @@ def _make_traverse_staging_dir(stage: str, traverse_root: str) -> None:
     os.mkdir(_dir)
 
 
-def _write_file(path: str, size: str) -> None:
+def _write_file(path: str, bytes_: int) -> None:
     """Write sparse file."""
-    with open(path, "wb") as f:
-        bytes_ = int(bitmath.parse_string_unsafe(size).to_Byte())
-        f.seek(bytes_)
-        f.write(str.encode("0"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, bytes_)  # extends w/ a hole, no data is written
+    finally:
+        os.close(fd)
 
 
 def _write_n_files(root: str, num: int) -> None:
@@ -46,24 +75,59 @@ def _write_n_files(root: str, num: int) -> None:
     os.makedirs(root, exist_ok=True)
 
     for i in range(1, num):
-        size = f"{i*100}KiB"
-        _write_file(f"{root}/{size}", size)
+        _write_file(f"{root}/{i*100}KiB", i * 100 * 1024)
+
+
+def _write_tree(root: str) -> None:
+    """Write a bunch of files and directories under `root`."""
+    _write_n_files(f"{root}/alpha", 15)
+    _write_n_files(f"{root}/beta", 10)
+    _write_n_files(f"{root}/beta/one", 1)
+    _write_n_files(f"{root}/beta/two", 3)
+    _write_n_files(f"{root}/gamma/one", 20)
+
+
+def _write_traverse_file(fpath: str, root: str) -> None:
+    """Write a sorted listing of `root` and every path under it (like a traverse)."""
+    paths = [f"{root}/"]
+    for dirpath, dirnames, filenames in os.walk(root):
+        paths.extend(os.path.join(dirpath, n) for n in dirnames)
+        paths.extend(os.path.join(dirpath, n) for n in filenames)
+    paths.sort()
+    with open(fpath, "w") as f:
+        f.write("\n".join(paths) + "\n")
+
+
+def _write_previous_traverse(fpath: str, root: str, prefix: str = "") -> None:
+    """Write a previous-traverse file: 10 of the filepaths under `root`.
+
+    Sort it with `sort`, like a real traverse, so `comm` can compare against it.
+    """
+    filepaths = sorted(
+        os.path.join(dirpath, n)
+        for dirpath, _, filenames in os.walk(root)
+        for n in filenames
+    )
+    with open(fpath, "w") as f:
+        f.write(prefix + "".join(fp + "\n" for fp in filepaths[5:15]))
+    subprocess.check_call(["sort", "-o", fpath, fpath])
 
 
 def _setup_testfiles(tmp_root: Path, suffix: str) -> Tuple[str, str]:
     """Create a bunch of files and directories.
 
+    Each call gets its own directory under `tmp_root`, so nothing needs to be
+    removed between cases -- the session cleans up `tmp_root`.
+
     Return traverse root and staging directory.
     """
+    base = tempfile.mkdtemp(dir=tmp_root)
+
     # write files
-    _write_n_files(f"{tmp_root}/test-traverse-{suffix}/alpha", 15)
-    _write_n_files(f"{tmp_root}/test-traverse-{suffix}/beta", 10)
-    _write_n_files(f"{tmp_root}/test-traverse-{suffix}/beta/one", 1)
-    _write_n_files(f"{tmp_root}/test-traverse-{suffix}/beta/two", 3)
-    _write_n_files(f"{tmp_root}/test-traverse-{suffix}/gamma/one", 20)
+    _write_tree(f"{base}/test-traverse-{suffix}")
 
     # make dirs
-    root = common_args.get_full_path(f"{tmp_root}/test-traverse-{suffix}")
+    root = common_args.get_full_path(f"{base}/test-traverse-{suffix}")
     stage = f"{root}-stage"
     os.makedirs(stage)
     stage = common_args.get_full_path(stage)
@@ -71,17 +135,21 @@ def _setup_testfiles(tmp_root: Path, suffix: str) -> Tuple[str, str]:
     return stage, root
 
 
-def _remove_all(*args: Any) -> None:
-    """Delete directories (recursively) and/or files."""
-    for f in args:
-        try:
-            shutil.rmtree(f)
-        except NotADirectoryError:
-            os.remove(f)
+def _get_archive_file(stage: str) -> os.DirEntry:
+    with os.scandir(stage) as it:
+        return next(d for d in it if d.is_file(follow_symlinks=False))
 
 
-def _get_archive_file(stage: str) -> os.DirEntry:
-    return [d for d in os.scandir(stage) if stat.S_ISREG(os.lstat(d.path).st_mode)][0]
+# a traverse staging directory's contents, keyed by (ran_via_shell, no_traverser_log)
+# -- "path_collector.log" is only written by main()
+_EXPECTED_STAGING_FILES = {
+    (True, False): frozenset(
+        {"argv.txt", "traverser.log", "traverse-chunks", "path_collector.log"}
+    ),
+    (True, True): frozenset({"argv.txt", "traverse-chunks", "path_collector.log"}),
+    (False, False): frozenset({"argv.txt", "traverser.log", "traverse-chunks"}),
+    (False, True): frozenset({"argv.txt", "traverse-chunks"}),
+}
 
 
 def _assert_out_files(
@@ -91,36 +159,25 @@ def _assert_out_files(
 ) -> None:
     """Test outputted files and directories."""
     # 2 entries in staging directory
-    assert len(os.listdir(stage)) == 2
+    entries = list(os.scandir(stage))
+    assert len(entries) == 2
 
     # 1 dir in staging directory
-    stage_dirs = [
-        d for d in os.scandir(stage) if stat.S_ISDIR(os.lstat(d.path).st_mode)
-    ]
+    stage_dirs = [d for d in entries if d.is_dir(follow_symlinks=False)]
     assert len(stage_dirs) == 1
 
     # 1 file in staging directory
-    stage_files = [
-        d for d in os.scandir(stage) if stat.S_ISREG(os.lstat(d.path).st_mode)
-    ]
+    stage_files = [d for d in entries if d.is_file(follow_symlinks=False)]
     assert len(stage_files) == 1
 
     # the files in traverse staging directory...
-    expected_files = [
-        "argv.txt",
-        "traverser.log",
-        "traverse-chunks",
-        "path_collector.log",
-    ]
-    if no_traverser_log:
-        expected_files.remove("traverser.log")
-    if not ran_via_shell:
-        expected_files.remove("path_collector.log")
-    assert set(os.listdir(stage_dirs[0])) == set(expected_files)
+    expected_files = _EXPECTED_STAGING_FILES[(ran_via_shell, no_traverser_log)]
+    assert frozenset(os.listdir(stage_dirs[0])) == expected_files
 
 
 def _get_traverse_staging_dir(stage: str) -> os.DirEntry:
-    return [d for d in os.scandir(stage) if stat.S_ISDIR(os.lstat(d.path).st_mode)][0]
+    with os.scandir(stage) as it:
+        return next(d for d in it if d.is_dir(follow_symlinks=False))
 
 
 def _get_traverser_log(stage: str) -> str:
@@ -132,422 +189,493 @@ def _get_chunks_dir(stage: str) -> str:
 
 
 def _get_chunk_0(stage: str) -> os.DirEntry:
-    return list(os.scandir(_get_chunks_dir(stage)))[0]
+    with os.scandir(_get_chunks_dir(stage)) as it:
+        return next(it)
 
 
 def _assert_out_chunks(stage: str, chunk_size: int) -> None:
     """Test outputted chunk-files."""
-    all_lines: List[str] = []
-    paths_dir = _get_chunks_dir(stage)
-    assert os.listdir(paths_dir)
+    # list the chunks once
+    with os.scandir(_get_chunks_dir(stage)) as it:
+        chunks = list(it)
+    assert chunks
 
     # no chunking
     if chunk_size == 0:
-        assert os.listdir(paths_dir) == ["chunk-0"]
+        assert [c.name for c in chunks] == ["chunk-0"]
         logging.info("chunk-0")
-        with open(_get_chunk_0(stage), "r") as f:
-            all_lines = [ln.strip() for ln in f]
+        # chunk-0 is a copy of the archive file
+        assert filecmp.cmp(chunks[0].path, _get_archive_file(stage), shallow=False)
     # yes chunking
     else:
-
-        def _is_last_chunk(_chunk_name: str) -> bool:
-            return _chunk_name == sorted(os.listdir(paths_dir))[-1]
-
+        all_lines: List[str] = []
+        last_chunk_name = max(c.name for c in chunks)
         nums: List[int] = []
-        for chunk in os.scandir(paths_dir):
-            # assert chunk name # pylint: disable=C0325
-            assert (match := re.match(r"chunk-(?P<num>\d+)", chunk.name))
-            assert int(match.groupdict()["num"]) not in nums
-            nums.append(int(match.groupdict()["num"]))
+        for chunk in chunks:
+            # assert chunk name
+            match = _CHUNK_RE.match(chunk.name)
+            assert match
+            num = int(match.group(1))
+            assert num not in nums
+            nums.append(num)
             # assert about chunk's aggregate size
             with open(chunk.path, "r") as f:
                 lines = [ln.strip() for ln in f]
                 all_lines.extend(lines)
+                # stat each file once
+                sizes = [int(os.stat(ln).st_size) for ln in lines]
+                total = sum(sizes)
                 # log
                 logging.info(f"{chunk.path=}")
-                logging.debug({ln: os.stat(ln).st_size for ln in lines})
-                if not _is_last_chunk(chunk.name):
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(dict(zip(lines, sizes)))
+                if chunk.name != last_chunk_name:
                     # check that the chunk's aggregate size is not less than `chunk_size`
-                    assert sum(int(os.stat(ln).st_size) for ln in lines) >= chunk_size
+                    assert total >= chunk_size
                     # check that the last chunk was what pushed it past the limit
-                    assert (
-                        sum(int(os.stat(ln).st_size) for ln in lines[:-1]) < chunk_size
-                    )
+                    assert total - sizes[-1] < chunk_size
                 else:
-                    assert sum(int(os.stat(ln).st_size) for ln in lines)
+                    assert total
         # assert all the chunks are there
         for num, i in zip(sorted(nums), range(1, len(nums) + 1)):
             assert i == num
 
-    # assert the archive file and the chunk(s) have the same content
-    with open(_get_archive_file(stage), "r") as f:
-        assert set(all_lines) == set(ln.strip() for ln in f)
+        # assert the archive file and the chunks have the same content
+        with open(_get_archive_file(stage), "r") as f:
+            assert set(all_lines) == set(f.read().splitlines())
+
+
+def _shell_cmd(root: str, stage: str, *args: str) -> List[str]:
+    """Get the command to run path_collector.py with this interpreter."""
+    return [
+        sys.executable,
+        "-m",
+        "resources.path_collector.path_collector",
+        root,
+        "--staging-dir",
+        stage,
+        "--workers",
+        "1",
+        *args,
+    ]
+
+
+def _chunk_size_via_shell(stage: str, root: str, chunk_size: int) -> None:
+    subprocess.check_call(
+        _shell_cmd(root, stage, "--chunk-size", str(chunk_size)), cwd="."
+    )
+
+
+def _chunk_size_via_direct(stage: str, root: str, chunk_size: int) -> None:
+    _make_traverse_staging_dir(stage, root)
+    path_collector.write_all_filepaths_to_files(
+        stage, root, 1, "", chunk_size, [], None
+    )
 
 
-def test_chunk_size(tmp_path: Path) -> None:
+@pytest.mark.parametrize("kibs", [0] + [10**i for i in range(0, 8)])
+def test_chunk_size(kibs: int, prebuilt_root: str, fast_tmp_path: Path) -> None:
     """Test using --chunk-size."""
+    chunk_size = kibs * 1024
+    logging.warning(f"chunk_size => {kibs} KiB ({chunk_size} bytes)")
+    # the tree is only read, so share it -- each case gets its own (empty) stage
+    root = prebuilt_root
+    stage = common_args.get_full_path(str(fast_tmp_path))
+    _chunk_size_via_direct(stage, root, chunk_size)
+    _assert_out_files(stage, False)
+    _assert_out_chunks(stage, chunk_size)
 
-    def _shell() -> None:
-        subprocess.check_call(
-            f"python3 -m resources.path_collector.path_collector {root}"
-            f" --staging-dir {stage}"
-            f" --workers 1"
-            f" --chunk-size {chunk_size}".split(),
-            cwd=".",
-        )
 
-    def _direct() -> None:
-        _make_traverse_staging_dir(stage, root)
-        path_collector.write_all_filepaths_to_files(
-            stage, root, 1, "", chunk_size, [], None
-        )
+def test_chunk_size_shell_smoke(prebuilt_root: str, fast_tmp_path: Path) -> None:
+    """Test --chunk-size via the command line, once.
 
-    for func in [_direct, _shell]:
-        logging.warning(f"Using invocation function: {func}")
-        now = str(time.time())
+    `test_chunk_size` covers the chunking logic in-process; this covers `main()`.
+    """
+    root = prebuilt_root
+    stage = common_args.get_full_path(str(fast_tmp_path))
+    _chunk_size_via_shell(stage, root, 0)
+    _assert_out_files(stage, True)
+    _assert_out_chunks(stage, 0)
 
-        for kibs in [0] + [10**i for i in range(0, 8)]:
-            print("~ " * 60)
-            chunk_size = int(bitmath.parse_string(f"{kibs}KiB").to_Byte())
-            logging.warning(
-                f"chunk_size => {bitmath.best_prefix(chunk_size).format('{value:.2f} {unit}')} ({chunk_size} bytes)"
-            )
-            stage, root = _setup_testfiles(tmp_path, f"{now}-{kibs}KiB")
-            func()
-            _assert_out_files(stage, func == _shell)
-            _assert_out_chunks(stage, chunk_size)
-            _remove_all(stage, root)
+
+def _fast_forward_via_shell(
+    stage: str, root: str, ff_traverse_file: str, chunk_size: int
+) -> None:
+    _make_traverse_staging_dir(stage, root)
+    shutil.copy(ff_traverse_file, _get_traverse_staging_dir(stage))
+    subprocess.check_call(
+        _shell_cmd(root, stage, "--fast-forward", "--chunk-size", str(chunk_size)),
+        cwd=".",
+    )
+    # assert that fast-forwarding happened by checking the log file
+    found = False
+    with open(
+        os.path.join(_get_traverse_staging_dir(stage), "path_collector.log")
+    ) as f:
+        for line in f.readlines():
+            if "Fast-forwarding past traversing..." in line:
+                found = True
+    assert found
+
+
+def _fast_forward_via_direct(
+    stage: str, root: str, ff_traverse_file: str, chunk_size: int
+) -> None:
+    _make_traverse_staging_dir(stage, root)
+    path_collector.write_all_filepaths_to_files(
+        stage, root, 1, "", chunk_size, [], ff_traverse_file
+    )
 
 
-def test_w_fast_forward(tmp_path: Path) -> None:  # pylint: disable=R0915
+def test_w_fast_forward(fast_tmp_path: Path) -> None:  # pylint: disable=R0915
     """Test using --fast-forward."""
-    chunk_size: Final[int] = int(bitmath.parse_string("500MiB").to_Byte())
-
-    def _shell(ff_traverse_file: str, w_chunks: bool = False) -> None:
-        _make_traverse_staging_dir(stage, root)
-        shutil.copy(ff_traverse_file, _get_traverse_staging_dir(stage))
-        if w_chunks:
-            subprocess.check_call(
-                f"python3 -m resources.path_collector.path_collector {root}"
-                f" --staging-dir {stage}"
-                f" --fast-forward"
-                f" --chunk-size {chunk_size}"
-                f" --workers 1".split(),
-                cwd=".",
-            )
-        else:
-            subprocess.check_call(
-                f"python3 -m resources.path_collector.path_collector {root}"
-                f" --staging-dir {stage}"
-                f" --fast-forward"
-                f" --chunk-size 0"
-                f" --workers 1".split(),
-                cwd=".",
-            )
-        # assert that fast-forwarding happened by checking the log file
-        found = False
-        with open(
-            os.path.join(_get_traverse_staging_dir(stage), "path_collector.log")
-        ) as f:
-            for line in f.readlines():
-                if "Fast-forwarding past traversing..." in line:
-                    found = True
-        assert found
+    chunk_size: Final[int] = 500 * 1024**2  # 500MiB
+    traverse_raw = str(fast_tmp_path / "traverse.raw")
 
     def _direct(ff_traverse_file: str, w_chunks: bool = False) -> None:
-        _make_traverse_staging_dir(stage, root)
-        if w_chunks:
-            path_collector.write_all_filepaths_to_files(
-                stage, root, 1, "", chunk_size, [], ff_traverse_file
-            )
-        else:
-            path_collector.write_all_filepaths_to_files(
-                stage, root, 1, "", 0, [], ff_traverse_file
-            )
-
-    # TEST
-    for func in [_direct, _shell]:
-        logging.warning(f"Using invocation function: {func}")
-
-        #
-        # test good traverse file w/o chunking
-        print("~ " * 60)
-        logging.warning("ff_traverse_file => good (no chunks)")
-        stage, root = _setup_testfiles(tmp_path, "good-traverse-file")
-        with open("traverse.raw", "w") as f:
-            f.writelines(
-                sorted(ln + "\n" for ln in glob.glob(f"{root}/**", recursive=True))
-            )
-        func("traverse.raw")
-        _assert_out_files(stage, func == _shell, no_traverser_log=True)
-        assert filecmp.cmp(_get_archive_file(stage), "traverse.raw")
-        assert filecmp.cmp(_get_chunk_0(stage), "traverse.raw")
-        _remove_all(stage, root, "traverse.raw")
-
-        #
-        # test good traverse file w/ chunking
-        print("~ " * 60)
-        logging.warning("ff_traverse_file => good (w/ chunks)")
-        stage, root = _setup_testfiles(tmp_path, "good-traverse-file")
-        with open("traverse.raw", "w") as f:
-            f.writelines(
-                sorted(ln + "\n" for ln in glob.glob(f"{root}/**", recursive=True))
-            )
-        func("traverse.raw", w_chunks=True)
-        _assert_out_files(stage, func == _shell, no_traverser_log=True)
-        assert filecmp.cmp(_get_archive_file(stage), "traverse.raw")
-        _assert_out_chunks(stage, chunk_size)
-        _remove_all(stage, root, "traverse.raw")
-
-        #
-        # test empty traverse file w/o chunking
-        # -- there will be a traverse-chunks/chunk-0 file, but it's empty
-        print("~ " * 60)
-        logging.warning("ff_traverse_file => empty (no chunks)")
-        with open("traverse.raw", "w") as f:
-            pass
-        stage, root = _setup_testfiles(tmp_path, "empty-traverse-file")
-        func("traverse.raw")
-        _assert_out_files(stage, func == _shell, no_traverser_log=True)
-        assert int(os.lstat("traverse.raw").st_size) == 0
-        assert (
-            len(os.listdir(_get_chunks_dir(stage))) == 1
-        )  # 'chunk-0' in traverse-chunks/
-        assert filecmp.cmp(_get_archive_file(stage), "traverse.raw")
-        assert filecmp.cmp(_get_chunk_0(stage), "traverse.raw")
-        _remove_all(stage, root, "traverse.raw")
-
-        #
-        # test empty traverse file w/ chunking
-        # -- there will be a traverse-chunks/ directory, but it's empty
-        print("~ " * 60)
-        logging.warning("ff_traverse_file => empty (w/ chunks)")
-        with open("traverse.raw", "w") as f:
-            pass
-        stage, root = _setup_testfiles(tmp_path, "empty-traverse-file")
-        func("traverse.raw", w_chunks=True)
-        _assert_out_files(stage, func == _shell, no_traverser_log=True)
-        assert int(os.lstat("traverse.raw").st_size) == 0
-        assert not os.listdir(_get_chunks_dir(stage))  # empty traverse-chunks/
-        assert filecmp.cmp(_get_archive_file(stage), "traverse.raw")
-        _remove_all(stage, root, "traverse.raw")
-
-        #
-        # test traverse file w/ bad lines (filepaths) w/o chunking
-        # -- there will be a traverse-chunks/chunk-0 file that contains all the lines
-        print("~ " * 60)
-        logging.warning("ff_traverse_file => bad-filepaths")
-        with open("traverse.raw", "w") as f:
-            f.write("a-foo\nb-bar\nc-baz\n")
-        stage, root = _setup_testfiles(tmp_path, "bad-filepaths-traverse-file")
-        func("traverse.raw")
-        _assert_out_files(stage, func == _shell, no_traverser_log=True)
-        assert filecmp.cmp(_get_archive_file(stage), "traverse.raw")
-        # 'chunk-0' in traverse-chunks/
-        assert len(os.listdir(_get_chunks_dir(stage))) == 1
-        assert filecmp.cmp(_get_chunk_0(stage), "traverse.raw")
-        _remove_all(stage, root, "traverse.raw")
-
-        #
-        # test traverse file w/ bad lines (filepaths) w/ chunking
-        # -- there will be a traverse-chunks/ directory, but it's empty
-        # -- there is an archive file and argv.txt
-        print("~ " * 60)
-        logging.warning("ff_traverse_file => bad-filepaths (w/ chunks)")
-        with open("traverse.raw", "w") as f:
-            f.write("a-foo\nb-bar\nc-baz\n")
-        stage, root = _setup_testfiles(tmp_path, "bad-filepaths-traverse-file")
-        func("traverse.raw", w_chunks=True)
-        _assert_out_files(stage, func == _shell, no_traverser_log=True)
-        assert os.path.exists(_get_chunks_dir(stage))
-        _get_archive_file(stage)  # no raised exception AKA file exists
-        assert not os.listdir(_get_chunks_dir(stage))  # empty dir
-        assert "argv.txt" in os.listdir(_get_traverse_staging_dir(stage))
-        _remove_all(stage, root, "traverse.raw")
-
-
-def test_exclude(tmp_path: Path) -> None:
-    """Test using --exclude."""
-    chunk_size: Final[int] = int(bitmath.parse_string("500MiB").to_Byte())
-
-    def _shell(excludes: List[str]) -> None:
-        subprocess.check_call(
-            f"python3 -m resources.path_collector.path_collector {root}"
-            f" --staging-dir {stage}"
-            f" --workers 1"
-            f" --exclude {' '.join(os.path.abspath(e) for e in excludes)}"
-            f" --chunk-size {chunk_size}".split(),
-            cwd=".",
+        _fast_forward_via_direct(
+            stage, root, ff_traverse_file, chunk_size if w_chunks else 0
         )
 
-    def _direct(excludes: List[str]) -> None:
-        _make_traverse_staging_dir(stage, root)
-        path_collector.write_all_filepaths_to_files(
-            stage, root, 1, "", chunk_size, excludes, None
-        )
+    #
+    # test good traverse file w/o chunking
+    print("~ " * 60)
+    logging.warning("ff_traverse_file => good (no chunks)")
+    stage, root = _setup_testfiles(fast_tmp_path, "good-traverse-file")
+    _write_traverse_file(traverse_raw, root)
+    _direct(traverse_raw)
+    _assert_out_files(stage, False, no_traverser_log=True)
+    assert filecmp.cmp(_get_archive_file(stage), traverse_raw)
+    assert filecmp.cmp(_get_chunk_0(stage), traverse_raw)
 
-    for func in [_direct, _shell]:
-        logging.warning(f"Using invocation function: {func}")
-
-        #
-        # good excludes
-        print("~ " * 60)
-        logging.warning("exclude => good")
-        stage, root = _setup_testfiles(tmp_path, "good-excludes")
-        logging.error(f"{stage=} {root=}")
-        func(
-            [
-                f"{root}/gamma",
-                f"{root}/beta/two",
-            ]
-        )
-        _assert_out_files(stage, func == _shell)
-        _assert_out_chunks(stage, chunk_size)
-        with open(_get_archive_file(stage)) as f:
-            lines = f.read()
-            assert lines
-        for e in ["gamma", "beta/two"]:
-            assert e not in lines
-        _remove_all(stage, root)
-
-        #
-        # real but needless excludes
-        print("~ " * 60)
-        logging.warning("exclude => real but needless")
-        stage, root = _setup_testfiles(tmp_path, "real-but-needless-excludes")
-        func(["./.gitignore", "./README.md"])
-        _assert_out_files(stage, func == _shell)
-        _assert_out_chunks(stage, chunk_size)
-        with open(_get_archive_file(stage)) as f:
-            lines = f.read()
-            assert lines
-        for e in [".gitignore", "README.md"]:
-            assert e not in lines
-        _remove_all(stage, root)
-
-        #
-        # bad excludes
-        print("~ " * 60)
-        logging.warning("exclude => bad")
-        stage, root = _setup_testfiles(tmp_path, "bad-excludes")
-        with pytest.raises(subprocess.CalledProcessError):  # raised by traverser.py
-            func(["./foo", "./bar"])
-        if func == _direct:
-            with open(_get_traverser_log(stage)) as f:
-                assert "FileNotFoundError" in f.read()
-        # when using _shell, it's a nested CalledProcessError, so no files are written
-        _remove_all(stage, root)
-
-
-def test_previous_traverse(tmp_path: Path) -> None:
-    """Test using --previous-traverse."""
+    #
+    # test good traverse file w/ chunking
+    print("~ " * 60)
+    logging.warning("ff_traverse_file => good (w/ chunks)")
+    stage, root = _setup_testfiles(fast_tmp_path, "good-traverse-file")
+    _write_traverse_file(traverse_raw, root)
+    _direct(traverse_raw, w_chunks=True)
+    _assert_out_files(stage, False, no_traverser_log=True)
+    assert filecmp.cmp(_get_archive_file(stage), traverse_raw)
+    _assert_out_chunks(stage, chunk_size)
 
-    def _shell(prev_traverse: str) -> None:
-        subprocess.check_call(
-            f"python3 -m resources.path_collector.path_collector {root}"
-            f" --staging-dir {stage}"
-            f" --previous-traverse {prev_traverse}"
-            f" --chunk-size 0"
-            f" --workers 1".split(),
-            cwd=".",
-        )
+    #
+    # test empty traverse file w/o chunking
+    # -- there will be a traverse-chunks/chunk-0 file, but it's empty
+    print("~ " * 60)
+    logging.warning("ff_traverse_file => empty (no chunks)")
+    with open(traverse_raw, "w") as f:
+        pass
+    stage, root = _setup_testfiles(fast_tmp_path, "empty-traverse-file")
+    _direct(traverse_raw)
+    _assert_out_files(stage, False, no_traverser_log=True)
+    assert int(os.lstat(traverse_raw).st_size) == 0
+    assert (
+        len(os.listdir(_get_chunks_dir(stage))) == 1
+    )  # 'chunk-0' in traverse-chunks/
+    assert filecmp.cmp(_get_archive_file(stage), traverse_raw)
+    assert filecmp.cmp(_get_chunk_0(stage), traverse_raw)
 
-    def _direct(prev_traverse: str) -> None:
-        _make_traverse_staging_dir(stage, root)
-        path_collector.write_all_filepaths_to_files(
-            stage, root, 1, prev_traverse, 0, [], None
-        )
+    #
+    # test empty traverse file w/ chunking
+    # -- there will be a traverse-chunks/ directory, but it's empty
+    print("~ " * 60)
+    logging.warning("ff_traverse_file => empty (w/ chunks)")
+    with open(traverse_raw, "w") as f:
+        pass
+    stage, root = _setup_testfiles(fast_tmp_path, "empty-traverse-file")
+    _direct(traverse_raw, w_chunks=True)
+    _assert_out_files(stage, False, no_traverser_log=True)
+    assert int(os.lstat(traverse_raw).st_size) == 0
+    assert not os.listdir(_get_chunks_dir(stage))  # empty traverse-chunks/
+    assert filecmp.cmp(_get_archive_file(stage), traverse_raw)
 
-    for func in [_direct, _shell]:
-        logging.warning(f"Using invocation function: {func}")
-
-        # good previous-traverse
-        print("~ " * 60)
-        logging.warning("previous-traverse => good")
-        with open("./archive-prev.txt", "w") as f:
-            stage, root = _setup_testfiles(tmp_path, "previous")
-            _make_traverse_staging_dir(stage, root)
-            path_collector.write_all_filepaths_to_files(stage, root, 1, "", 0, [], None)
-            with open(_get_archive_file(stage), "r") as a_f:
-                f.writelines(a_f.readlines()[5:15])
-        _remove_all(stage, root)
-        stage, root = _setup_testfiles(tmp_path, "prev-traverse-good")
-        func("./archive-prev.txt")
-        _assert_out_files(stage, func == _shell)
-        _assert_out_chunks(stage, 0)
-        with open(_get_archive_file(stage), "r") as a_f:
-            with open("./archive-prev.txt", "r") as p_f:
-                assert all(ln not in a_f.readlines() for ln in p_f.readlines())
-        _remove_all(stage, root, "./archive-prev.txt")
-
-        # bad lines previous-traverse
-        # -- just as okay as good lines
-        print("~ " * 60)
-        logging.warning("previous-traverse => bad lines")
-        with open("./archive-prev.txt", "w") as f:
-            stage, root = _setup_testfiles(tmp_path, "previous")
-            _make_traverse_staging_dir(stage, root)
-            path_collector.write_all_filepaths_to_files(stage, root, 1, "", 0, [], None)
-            with open(_get_archive_file(stage), "r") as a_f:
-                f.writelines(["!FOOBARBAZ!"] + a_f.readlines()[5:15])
-        _remove_all(stage, root)
-        stage, root = _setup_testfiles(tmp_path, "prev-traverse-bad-lines")
-        func("./archive-prev.txt")
-        _assert_out_files(stage, func == _shell)
-        _assert_out_chunks(stage, 0)
-        with open(_get_archive_file(stage), "r") as a_f:
-            with open("./archive-prev.txt", "r") as p_f:
-                assert all(ln not in a_f.readlines() for ln in p_f.readlines())
-        _remove_all(stage, root, "./archive-prev.txt")
-
-
-def test_fast_forward_logic(tmp_path: Path) -> None:
-    """Test using --fast-forward."""
     #
-    # test good use of fast_forward w/o an existing traverse_staging_dir
-    stage, root = _setup_testfiles(tmp_path, "w-fast_forward-no-traverse-staging-dir")
+    # test traverse file w/ bad lines (filepaths) w/o chunking
+    # -- there will be a traverse-chunks/chunk-0 file that contains all the lines
+    print("~ " * 60)
+    logging.warning("ff_traverse_file => bad-filepaths")
+    with open(traverse_raw, "w") as f:
+        f.write("a-foo\nb-bar\nc-baz\n")
+    stage, root = _setup_testfiles(fast_tmp_path, "bad-filepaths-traverse-file")
+    _direct(traverse_raw)
+    _assert_out_files(stage, False, no_traverser_log=True)
+    assert filecmp.cmp(_get_archive_file(stage), traverse_raw)
+    # 'chunk-0' in traverse-chunks/
+    assert len(os.listdir(_get_chunks_dir(stage))) == 1
+    assert filecmp.cmp(_get_chunk_0(stage), traverse_raw)
+
+    #
+    # test traverse file w/ bad lines (filepaths) w/ chunking
+    # -- there will be a traverse-chunks/ directory, but it's empty
+    # -- there is an archive file and argv.txt
+    print("~ " * 60)
+    logging.warning("ff_traverse_file => bad-filepaths (w/ chunks)")
+    with open(traverse_raw, "w") as f:
+        f.write("a-foo\nb-bar\nc-baz\n")
+    stage, root = _setup_testfiles(fast_tmp_path, "bad-filepaths-traverse-file")
+    _direct(traverse_raw, w_chunks=True)
+    _assert_out_files(stage, False, no_traverser_log=True)
+    assert os.path.exists(_get_chunks_dir(stage))
+    _get_archive_file(stage)  # no raised exception AKA file exists
+    assert not os.listdir(_get_chunks_dir(stage))  # empty dir
+    assert "argv.txt" in os.listdir(_get_traverse_staging_dir(stage))
+
+
+def test_w_fast_forward_shell_smoke(fast_tmp_path: Path) -> None:
+    """Test --fast-forward via the command line, once.
+
+    `test_w_fast_forward` covers the fast-forward cases in-process; this covers
+    `main()` picking up the traverse file.
+    """
+    traverse_raw = str(fast_tmp_path / "traverse.raw")
+    stage, root = _setup_testfiles(fast_tmp_path, "good-traverse-file")
+    _write_traverse_file(traverse_raw, root)
+    _fast_forward_via_shell(stage, root, traverse_raw, 0)
+    _assert_out_files(stage, True, no_traverser_log=True)
+    assert filecmp.cmp(_get_archive_file(stage), traverse_raw)
+    assert filecmp.cmp(_get_chunk_0(stage), traverse_raw)
+
+
+def _exclude_via_shell(
+    stage: str, root: str, excludes: List[str], chunk_size: int
+) -> None:
     subprocess.check_call(
-        f"python3 -m resources.path_collector.path_collector {root}"
-        f" --staging-dir {stage}"
-        f" --workers 1"
-        f" --fast-forward".split(),
+        _shell_cmd(
+            root,
+            stage,
+            "--exclude",
+            *(os.path.abspath(e) for e in excludes),
+            "--chunk-size",
+            str(chunk_size),
+        ),
         cwd=".",
     )
-    _remove_all(stage, root)
 
-    #
-    # test good use of fast_forward w/ an existing traverse_staging_dir
-    stage, root = _setup_testfiles(tmp_path, "w-fast_forward-w-traverse-staging-dir")
+
+def _exclude_via_direct(
+    stage: str, root: str, excludes: List[str], chunk_size: int
+) -> None:
     _make_traverse_staging_dir(stage, root)
-    subprocess.check_call(
-        f"python3 -m resources.path_collector.path_collector {root}"
-        f" --staging-dir {stage}"
-        f" --workers 1"
-        f" --fast-forward".split(),
-        cwd=".",
+    path_collector.write_all_filepaths_to_files(
+        stage, root, 1, "", chunk_size, excludes, None
     )
-    _remove_all(stage, root)
+
+
+def test_exclude(fast_tmp_path: Path) -> None:
+    """Test using --exclude."""
+    chunk_size: Final[int] = 500 * 1024**2  # 500MiB
 
     #
-    # test w/o --fast-forward & w/o an existing traverse_staging_dir
-    stage, root = _setup_testfiles(tmp_path, "no-fast_forward-no-traverse-staging-dir")
+    # good excludes
+    print("~ " * 60)
+    logging.warning("exclude => good")
+    stage, root = _setup_testfiles(fast_tmp_path, "good-excludes")
+    logging.error(f"{stage=} {root=}")
+    _exclude_via_direct(
+        stage,
+        root,
+        [
+            f"{root}/gamma",
+            f"{root}/beta/two",
+        ],
+        chunk_size,
+    )
+    _assert_out_files(stage, False)
+    _assert_out_chunks(stage, chunk_size)
+    with open(_get_archive_file(stage)) as f:
+        lines = f.read()
+        assert lines
+    for e in ["gamma", "beta/two"]:
+        assert e not in lines
+
+    #
+    # real but needless excludes
+    print("~ " * 60)
+    logging.warning("exclude => real but needless")
+    stage, root = _setup_testfiles(fast_tmp_path, "real-but-needless-excludes")
+    _exclude_via_direct(stage, root, ["./.gitignore", "./README.md"], chunk_size)
+    _assert_out_files(stage, False)
+    _assert_out_chunks(stage, chunk_size)
+    with open(_get_archive_file(stage)) as f:
+        lines = f.read()
+        assert lines
+    for e in [".gitignore", "README.md"]:
+        assert e not in lines
+
+    #
+    # bad excludes
+    print("~ " * 60)
+    logging.warning("exclude => bad")
+    stage, root = _setup_testfiles(fast_tmp_path, "bad-excludes")
+    with pytest.raises(subprocess.CalledProcessError):  # raised by traverser.py
+        _exclude_via_direct(stage, root, ["./foo", "./bar"], chunk_size)
+    with open(_get_traverser_log(stage)) as f:
+        assert "FileNotFoundError" in f.read()
+
+
+def test_exclude_trailing_newline_sibling(fast_tmp_path: Path) -> None:
+    """Test that an excluded path doesn't also exclude its "<name>\\n" sibling."""
+    root = fast_tmp_path / "newline-sibling"
+    (root / "new").mkdir(parents=True)
+    _write_file(str(root / "new" / "inner"), 1)
+    _write_file(str(root / "new\n"), 1)
+
+    excluded_re = traverser.compile_excluded_paths([str(root / "new")])
+    assert traverser.is_excluded_path(os.fsencode(root / "new"), excluded_re)
+    assert traverser.is_excluded_path(os.fsencode(root / "new" / "inner"), excluded_re)
+    assert not traverser.is_excluded_path(os.fsencode(root / "new\n"), excluded_re)
+
+    subdirs, filepaths = traverser.scan_directory(os.fsencode(root), excluded_re)
+    assert subdirs == []
+    assert filepaths == [os.fsencode(root / "new\n")]
+
+
+@pytest.mark.parametrize("locale", ["C.UTF-8", "C"])
+def test_non_utf8_filename_skipped(locale: str, fast_tmp_path: Path) -> None:
+    """Test that a non-UTF-8 filename is skipped & logged, under any locale."""
+    root = fast_tmp_path / f"non-utf8-{locale}"
+    root.mkdir()
+    _write_file(str(root / "good"), 1)
+    _write_file(os.path.join(os.fsencode(root), b"bad-\xff"), 1)  # type: ignore[arg-type]
+
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "resources.path_collector.traverser",
+            str(root),
+            "--workers",
+            "1",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "LC_ALL": locale, "PYTHONIOENCODING": ""},
+    )
+    assert proc.stdout.splitlines() == [os.fsencode(root / "good")]
+    assert b"Invalid file name in: " + os.fsencode(root) in proc.stderr
+
+
+def test_exclude_shell_smoke(fast_tmp_path: Path) -> None:
+    """Test --exclude via the command line, once.
+
+    `test_exclude` covers the exclude cases in-process; this covers `main()`.
+    """
+    chunk_size: Final[int] = 500 * 1024**2  # 500MiB
+
+    stage, root = _setup_testfiles(fast_tmp_path, "good-excludes")
+    _exclude_via_shell(
+        stage,
+        root,
+        [
+            f"{root}/gamma",
+            f"{root}/beta/two",
+        ],
+        chunk_size,
+    )
+    _assert_out_files(stage, True)
+    _assert_out_chunks(stage, chunk_size)
+    with open(_get_archive_file(stage)) as f:
+        lines = f.read()
+        assert lines
+    for e in ["gamma", "beta/two"]:
+        assert e not in lines
+
+
+def _previous_traverse_via_shell(stage: str, root: str, prev_traverse: str) -> None:
     subprocess.check_call(
-        f"python3 -m resources.path_collector.path_collector {root}"
-        f" --staging-dir {stage}"
-        f" --workers 1".split(),
+        _shell_cmd(
+            root, stage, "--previous-traverse", prev_traverse, "--chunk-size", "0"
+        ),
         cwd=".",
     )
-    _remove_all(stage, root)
+
+
+def _previous_traverse_via_direct(stage: str, root: str, prev_traverse: str) -> None:
+    _make_traverse_staging_dir(stage, root)
+    path_collector.write_all_filepaths_to_files(
+        stage, root, 1, prev_traverse, 0, [], None
+    )
+
+
+def _assert_previous_traverse_applied(
+    stage: str, root: str, prev_traverse: str
+) -> None:
+    """Assert the previous traverse's filepaths, and only those, were left out."""
+    all_filepaths = {
+        os.path.join(dirpath, n)
+        for dirpath, _, filenames in os.walk(root)
+        for n in filenames
+    }
+    with open(prev_traverse) as f:
+        prev_filepaths = set(f.read().splitlines())
+    assert prev_filepaths & all_filepaths  # otherwise, there's nothing to leave out
+    with open(_get_archive_file(stage)) as f:
+        assert set(f.read().splitlines()) == all_filepaths - prev_filepaths
+
+
+def test_previous_traverse(fast_tmp_path: Path) -> None:
+    """Test using --previous-traverse."""
+    prev_traverse = str(fast_tmp_path / "archive-prev.txt")
+
+    # good previous-traverse
+    print("~ " * 60)
+    logging.warning("previous-traverse => good")
+    stage, root = _setup_testfiles(fast_tmp_path, "prev-traverse-good")
+    _write_previous_traverse(prev_traverse, root)
+    _previous_traverse_via_direct(stage, root, prev_traverse)
+    _assert_out_files(stage, False)
+    _assert_out_chunks(stage, 0)
+    _assert_previous_traverse_applied(stage, root, prev_traverse)
+
+    # bad lines previous-traverse
+    # -- just as okay as good lines
+    print("~ " * 60)
+    logging.warning("previous-traverse => bad lines")
+    stage, root = _setup_testfiles(fast_tmp_path, "prev-traverse-bad-lines")
+    _write_previous_traverse(prev_traverse, root, prefix="!FOOBARBAZ!")
+    _previous_traverse_via_direct(stage, root, prev_traverse)
+    _assert_out_files(stage, False)
+    _assert_out_chunks(stage, 0)
+    _assert_previous_traverse_applied(stage, root, prev_traverse)
+
+
+def test_previous_traverse_shell_smoke(fast_tmp_path: Path) -> None:
+    """Test --previous-traverse via the command line, once.
+
+    `test_previous_traverse` covers the cases in-process; this covers `main()`.
+    """
+    prev_traverse = str(fast_tmp_path / "archive-prev.txt")
+
+    stage, root = _setup_testfiles(fast_tmp_path, "prev-traverse-good")
+    _write_previous_traverse(prev_traverse, root)
+    _previous_traverse_via_shell(stage, root, prev_traverse)
+    _assert_out_files(stage, True)
+    _assert_out_chunks(stage, 0)
+    _assert_previous_traverse_applied(stage, root, prev_traverse)
+
+
+def test_fast_forward_logic(fast_tmp_path: Path) -> None:
+    """Test using --fast-forward."""
+    #
+    # test good use of fast_forward w/o an existing traverse_staging_dir
+    stage, root = _setup_testfiles(fast_tmp_path, "w-fast_forward-no-traverse-staging-dir")
+    subprocess.check_call(_shell_cmd(root, stage, "--fast-forward"), cwd=".")
+
+    #
+    # test good use of fast_forward w/ an existing traverse_staging_dir
+    stage, root = _setup_testfiles(fast_tmp_path, "w-fast_forward-w-traverse-staging-dir")
+    _make_traverse_staging_dir(stage, root)
+    subprocess.check_call(_shell_cmd(root, stage, "--fast-forward"), cwd=".")
+
+    #
+    # test w/o --fast-forward & w/o an existing traverse_staging_dir
+    stage, root = _setup_testfiles(fast_tmp_path, "no-fast_forward-no-traverse-staging-dir")
+    subprocess.check_call(_shell_cmd(root, stage), cwd=".")
 
     #
     # test w/o --fast-forward, but w/ an existing traverse_staging_dir
-    stage, root = _setup_testfiles(tmp_path, "no-fast_forward-w-traverse-staging-dir")
+    stage, root = _setup_testfiles(fast_tmp_path, "no-fast_forward-w-traverse-staging-dir")
     _make_traverse_staging_dir(stage, root)
     with pytest.raises(subprocess.CalledProcessError):
-        subprocess.check_call(
-            f"python3 -m resources.path_collector.path_collector {root}"
-            f" --staging-dir {stage}"
-            f" --workers 1".split(),
-            cwd=".",
-        )
-    _remove_all(stage, root)
+        subprocess.check_call(_shell_cmd(root, stage), cwd=".")
@@ -1,8 +1,9 @@
 """Example file metadata."""
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-EXAMPLES: Dict[str, Dict[str, Any]] = {
+_EXAMPLES: Dict[str, Dict[str, Any]] = {
     "L2/Level2_IC86.2011_corsika.010285.000000.i3.bz2": {
         "checksum": {
             "sha512": "f246b07132968374ded4627b2fc93c8af5a77468ced5b90327fe8ac00685e6ff549a61daac37a3fbbdf51a1a8add35cb10ed8d402ef89eaf1ed4c272da150331"
@@ -148,3 +149,8 @@ EXAMPLES: Dict[str, Dict[str, Any]] = {
         "processing_level": "Triggered",
     },
 }
+
+# read-only views -- copy an example before modifying it
+EXAMPLES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {fpath: MappingProxyType(metadata) for fpath, metadata in _EXAMPLES.items()}
+)
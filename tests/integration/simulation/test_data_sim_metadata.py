@@ -5,10 +5,20 @@
 3. metadata = metadata_file.generate()
 """
 
+from contextlib import ExitStack
+import copy
 from datetime import date
+from functools import lru_cache
 import json
-from os import listdir, path
-from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, patch
+import os
+from os import path
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Mapping, Optional
+from unittest.mock import ANY, PropertyMock, patch
+
+import pytest
+from rest_tools.client import RestClient
 
 from indexer import defaults
 from indexer.config import IndexerConfiguration, OAuthConfiguration, RestConfiguration
@@ -16,102 +26,193 @@ from indexer.metadata_manager import MetadataManager
 
 import tests.integration.simulation.sim_data as data
 
-SKIP_FIELDS = ["_links", "meta_modify_date", "uuid"]
+SKIP_FIELDS = frozenset({"_links", "meta_modify_date", "uuid"})
+
+_HERE = path.dirname(path.realpath(__file__))
+
+# every example file's (mocked) ctime -- so "create_date" doesn't depend on the checkout
+_CTIME = 1_600_000_000.0
+
+
+@lru_cache(maxsize=None)
+def _iceprod_version(dir_: str) -> Optional[str]:
+    """Return "ip1"/"ip2" for the directory's IceProd testing data, or `None`."""
+    for dir_entry in os.scandir(dir_):
+        if dir_entry.name.startswith("ip1-"):
+            return "ip1"
+        if dir_entry.name.startswith("ip2-"):
+            return "ip2"
+    return None
+
+
+def _read_json(fpath: str) -> Any:
+    return json.loads(Path(fpath).read_bytes())
+
+
+def _load_iceprod_data() -> Dict[str, Dict[str, Any]]:
+    """Parse each example directory's IceProd testing data (JSON files).
+
+    Keyed by directory path.
+    """
+    iceprod_data: Dict[str, Dict[str, Any]] = {}
+    for dir_entry in os.scandir(_HERE):
+        if not dir_entry.is_dir():
+            continue
+        dir_ = dir_entry.path
+        iceprod_version = _iceprod_version(dir_)
+        if iceprod_version == "ip1":
+            iceprod_data[dir_] = {
+                "sps": _read_json(path.join(dir_, "ip1-dataset-steering-params.json")),
+            }
+        elif iceprod_version == "ip2":
+            iceprod_data[dir_] = {
+                "datasets": _read_json(path.join(dir_, "ip2-datasets.json")),
+                "job_config": _read_json(path.join(dir_, "ip2-job-config.json")),
+                "tasks": _read_json(path.join(dir_, "ip2-dataset-tasks.json")),
+            }
+    return iceprod_data
+
 
+ICEPROD_DATA = _load_iceprod_data()
 
-@patch("rest_tools.client.RestClient.request_seq")
-@patch("pymysql.connect")
-@patch(
-    "indexer.metadata.simulation.iceprod_tools._IceProdV2Querier.filepath",
-    new_callable=PropertyMock,
+
+@pytest.fixture(scope="module")
+def manager() -> MetadataManager:
+    """Make one MetadataManager for all the examples."""
+    index_config: IndexerConfiguration = {
+        "basic_only": False,
+        "denylist": defaults.DENYLIST,
+        "denylist_file": defaults.DENYLIST_FILE,
+        "dryrun": False,
+        "iceprodv1_db_pass": ANY,
+        "n_processes": defaults.N_PROCESSES,
+        "non_recursive": False,
+        "patch": False,
+        "paths": defaults.PATHS,
+        "paths_file": defaults.PATHS_FILE,
+        "site": "WIPAC",
+    }
+    oauth_config: OAuthConfiguration = {
+        "oauth_client_id": "file-catalog-indexer",
+        "oauth_client_secret": "hunter2",
+        "oauth_url": "",
+    }
+    rest_config: RestConfiguration = {
+        "file_catalog_rest_url": "",
+        "iceprod_rest_url": "",
+        "rest_timeout": 60,
+        "rest_retries": 10,
+    }
+    # skip the OAuth client-credentials setup (OpenID discovery & key requests),
+    # a plain RestClient is enough since `RestClient.request_seq` is patched
+    with patch(
+        "indexer.metadata.simulation.iceprod_tools.create_iceprod_rest_client",
+        return_value=RestClient(""),
+    ):
+        return MetadataManager(index_config, oauth_config, rest_config)
+
+
+@pytest.fixture(scope="module")
+def patches() -> Iterator[SimpleNamespace]:
+    """Patch the factory logic, I3Reader, ctime, and IceProd access for all the examples.
+
+    Each example sets its own return values.
+    """
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            # MetadataManager.new_file's initial factory logic
+            is_data_exp_filepath=stack.enter_context(
+                patch("indexer.metadata_manager.MetadataManager._is_data_exp_filepath")
+            ),
+            is_data_sim_filepath=stack.enter_context(
+                patch("indexer.metadata_manager.MetadataManager._is_data_sim_filepath")
+            ),
+            # I3Reader-dependent method
+            get_events_data=stack.enter_context(
+                patch("indexer.metadata.i3.I3FileMetadata._get_events_data")
+            ),
+            # BasicFileMetadata's "create_date" -- swap out only `basic`'s `os`
+            # (its only use is `os.path.getctime`), not the global function
+            basic_os=stack.enter_context(
+                patch(
+                    "indexer.metadata.basic.os",
+                    new=SimpleNamespace(
+                        path=SimpleNamespace(getctime=lambda _: _CTIME)
+                    ),
+                )
+            ),
+            # iceprod_tool's filepath
+            iceprodv2querier_filepath=stack.enter_context(
+                patch(
+                    "indexer.metadata.simulation.iceprod_tools._IceProdV2Querier.filepath",
+                    new_callable=PropertyMock,
+                )
+            ),
+            # SQL queries & REST requests
+            pymysql_connect=stack.enter_context(patch("pymysql.connect")),
+            rest_client_request_seq=stack.enter_context(
+                patch("rest_tools.client.RestClient.request_seq")
+            ),
+        )
+
+
+@pytest.mark.parametrize(
+    "fpath,example", list(data.EXAMPLES.items()), ids=list(data.EXAMPLES)
 )
-@patch("indexer.metadata.i3.I3FileMetadata._get_events_data")
-@patch("indexer.metadata_manager.MetadataManager._is_data_sim_filepath")
-@patch("indexer.metadata_manager.MetadataManager._is_data_exp_filepath")
 def test_1(
-    _is_data_exp_filepath: Mock,
-    _is_data_sim_filepath: Mock,
-    _get_events_data: Mock,
-    _iceprodv2querier_filepath: PropertyMock,
-    pymysql_connect: Mock,
-    rest_client_request_seq: AsyncMock,
+    fpath: str,
+    example: Mapping[str, Any],
+    manager: MetadataManager,
+    patches: SimpleNamespace,
 ) -> None:
-    """Test all example passing cases."""
-    for fpath, metadata in data.EXAMPLES.items():
-        print(fpath)
-
-        # prep
-        fullpath = path.join(path.dirname(path.realpath(__file__)), fpath)
-        print(fullpath)
-        orignal_path = metadata["logical_name"]
-        metadata.update(
-            {
-                "logical_name": fullpath,
-                "locations": [
-                    {"site": metadata["locations"][0]["site"], "path": fullpath}
-                ],
-                "create_date": date.fromtimestamp(path.getctime(fullpath)).isoformat(),
-            }
-        )
+    """Test each example passing case."""
+    metadata = copy.deepcopy(dict(example))
 
-        # mock MetadataManager.new_file's initial factory logic
-        _is_data_sim_filepath.return_value = True
-        _is_data_exp_filepath.return_value = False
-        # mock I3Reader-dependent method
-        dummy_event_data = {"status": metadata["content_status"]}
-        _get_events_data.return_value = dummy_event_data
-        # mock iceprod_tool's filepath so output-file matching can work
-        _iceprodv2querier_filepath.return_value = orignal_path
-        # mock SQL queries & REST requests
-        dir_ = path.dirname(fullpath)
-        if any(f.startswith("ip1-") for f in listdir(dir_)):
-            with open(path.join(dir_, "ip1-dataset-steering-params.json")) as f:
-                sps = json.load(f)
-            pymysql_connect.return_value.cursor.return_value.fetchall.return_value = sps
-        elif any(f.startswith("ip2-") for f in listdir(dir_)):
-            with open(path.join(dir_, "ip2-datasets.json")) as f:
-                datasets = json.load(f)
-            with open(path.join(dir_, "ip2-job-config.json")) as f:
-                job_config = json.load(f)
-            with open(path.join(dir_, "ip2-dataset-tasks.json")) as f:
-                tasks = json.load(f)
-            rest_client_request_seq.side_effect = [datasets, job_config, tasks]
-        else:
-            raise Exception("Missing testing data")
-
-        # run
-        index_config: IndexerConfiguration = {
-            "basic_only": False,
-            "denylist": defaults.DENYLIST,
-            "denylist_file": defaults.DENYLIST_FILE,
-            "dryrun": False,
-            "iceprodv1_db_pass": ANY,
-            "n_processes": defaults.N_PROCESSES,
-            "non_recursive": False,
-            "patch": False,
-            "paths": defaults.PATHS,
-            "paths_file": defaults.PATHS_FILE,
-            "site": "WIPAC",
+    # prep
+    fullpath = path.join(_HERE, fpath)
+    orignal_path = metadata["logical_name"]
+    metadata.update(
+        {
+            "logical_name": fullpath,
+            "locations": [
+                {"site": metadata["locations"][0]["site"], "path": fullpath}
+            ],
+            "create_date": date.fromtimestamp(_CTIME).isoformat(),
         }
+    )
 
-        oauth_config: OAuthConfiguration = {
-            "oauth_client_id": "file-catalog-indexer",
-            "oauth_client_secret": "hunter2",
-            "oauth_url": "",
-        }
-        rest_config: RestConfiguration = {
-            "file_catalog_rest_url": "",
-            "iceprod_rest_url": "",
-            "rest_timeout": 60,
-            "rest_retries": 10,
-        }
-        manager = MetadataManager(index_config, oauth_config, rest_config)
-        metadata_file = manager.new_file(fullpath)
-        generated_metadata = metadata_file.generate()
-
-        # assert
-        for field in metadata:
-            if field in SKIP_FIELDS:
-                continue
-            print(field)
-            assert metadata[field] == generated_metadata[field]  # type: ignore[literal-required]
+    # mock MetadataManager.new_file's initial factory logic
+    patches.is_data_sim_filepath.return_value = True
+    patches.is_data_exp_filepath.return_value = False
+    # mock I3Reader-dependent method
+    dummy_event_data = {"status": metadata["content_status"]}
+    patches.get_events_data.return_value = dummy_event_data
+    # mock iceprod_tool's filepath so output-file matching can work
+    patches.iceprodv2querier_filepath.return_value = orignal_path
+    # mock SQL queries & REST requests
+    dir_ = path.dirname(fullpath)
+    iceprod_version = _iceprod_version(dir_)
+    if iceprod_version == "ip1":
+        sps = ICEPROD_DATA[dir_]["sps"]
+        cursor = patches.pymysql_connect.return_value.cursor.return_value
+        cursor.fetchall.return_value = sps
+    elif iceprod_version == "ip2":
+        patches.rest_client_request_seq.side_effect = [
+            ICEPROD_DATA[dir_]["datasets"],
+            ICEPROD_DATA[dir_]["job_config"],
+            ICEPROD_DATA[dir_]["tasks"],
+        ]
+    else:
+        raise Exception("Missing testing data")
+
+    # run
+    metadata_file = manager.new_file(fullpath)
+    generated_metadata = metadata_file.generate()
+
+    # assert
+    # compare all at once -- only build the per-field diff when there's a mismatch
+    expected = {k: v for k, v in metadata.items() if k not in SKIP_FIELDS}
+    actual = {k: generated_metadata[k] for k in expected}  # type: ignore[literal-required]
+    assert expected == actual, {
+        k: (expected[k], actual[k]) for k in expected if expected[k] != actual[k]
+    }
@@ -32,7 +32,7 @@ def test_check_path() -> None:
 
 def test_denylist() -> None:
     """Test filepath deny-listing."""
-    denylist = ["/foo/bar", "/foo/baz"]
+    denylist = ("/foo/bar", "/foo/baz")
 
     assert path_in_denylist("/foo/bar", denylist)
     assert path_in_denylist("/foo/baz", denylist)